@@ -6,9 +6,9 @@
 
 ###########################################
 
-# Eulerian_circuit_1 finds an Eulerian Circuit by creating list of vertices from the NetworkX Graph and removing them as seen. 
+# Eulerian_circuit_1 finds an Eulerian Circuit by converting the graph once into flat CSR-style arrays and marking edges as seen.
 
-# Eulerian_circuit_2 finds an Eulerian Circuit by using an adjacency matrix to determine which edges have already been seen.
+# Eulerian_circuit_2 finds an Eulerian Circuit by using a sparse adjacency matrix to determine which edges have already been seen.
 
 # Eulerian_circuit_3 finds an Eulerian circuit by creating a stack of unseen neighbours and popping them from the queue to form a circuit. 
 
@@ -21,154 +21,551 @@ import networkx as nx
 import numpy as np
 from collections import deque
 
+try:                                        # Numba is optional - the functions fall back to plain Python without it
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+###########################################
+
+def relabel_to_integers(G):
+
+    """
+    Parameters
+    ------------
+    G - a networkx graph with arbitrary hashable node labels
+
+    Returns
+    ------------
+    H - the graph with nodes relabelled to 0..N-1 (G itself when it is already labelled that way)
+    mapping - a dict taking the integer labels back to the originals, or None if no relabelling was needed
+
+    """
+
+    N = G.number_of_nodes()
+    if all(v in G for v in range(N)):                # Already labelled 0..N-1, so the arrays can be indexed directly
+        return G, None
+
+    H = nx.convert_node_labels_to_integers(G, label_attribute = 'orig')
+    mapping = {i: H.nodes[i]['orig'] for i in H}     # Remember the original label of each integer node
+
+    return H, mapping
+
+###########################################
+
+def graph_to_csr(G):
+
+    """
+    Parameters
+    ------------
+    G - a networkx graph with nodes labelled 0..N-1
+
+    Returns
+    ------------
+    row_ptr - int32 array of length N+1, cumulative degrees, so the neighbours of v sit in neighbours[row_ptr[v]:row_ptr[v+1]]
+    neighbours - int32 array of length 2m holding every half-edge's endpoint
+    edge_id - int32 array of length 2m giving each half-edge a shared id, so both directions of an edge point at the same slot
+
+    """
+
+    N = G.number_of_nodes()
+    m = G.number_of_edges()
+
+    degrees = [G.degree(v) for v in range(N)]                # Degree of each vertex, in node order
+    row_ptr = np.concatenate(([0], np.cumsum(degrees))).astype(np.int32)
+
+    neighbours = np.empty(2 * m, dtype = np.int32)           # Flat list of neighbours, one slice per vertex
+    edge_id = np.empty(2 * m, dtype = np.int32)              # Shared id so that an edge can be marked seen from either end
+    ids = {}
+    i = 0
+    for v in range(N):
+        for nb in G.adj[v]:
+            key = (v, nb) if v < nb else (nb, v)             # Canonical (small, large) key for the undirected edge
+            k = ids.setdefault(key, len(ids))
+            if nb == v:                                      # A self-loop counts 2 towards the degree but G.adj yields it once,
+                edge_id[i] = k                               # so emit its second half-edge here to keep the arrays aligned
+                neighbours[i] = v
+                i += 1
+            edge_id[i] = k
+            neighbours[i] = nb
+            i += 1
+
+    return row_ptr, neighbours, edge_id
+
+###########################################
+
+def hierholzer_kernel(neighbours, row_ptr, edge_id, used, start):
+
+    """
+    Parameters
+    ------------
+    neighbours, row_ptr, edge_id - CSR-style arrays from graph_to_csr
+    used - boolean array with one entry per edge, normally all False on entry
+    start - the vertex the circuit should start and end on
+
+    Returns
+    ------------
+    circuit - an int32 array of nodes which dictate an Eulerian circuit
+
+    """
+
+    m = used.shape[0]
+    cursor = row_ptr[:-1].copy()                     # Per-vertex position of the next candidate half-edge
+
+    stack = np.empty(m + 1, dtype = np.int32)        # Preallocated stack - at most one entry per edge plus the start vertex
+    circuit = np.empty(m + 1, dtype = np.int32)      # The finished circuit has exactly m + 1 entries
+    stack[0] = start
+    s_top = 1
+    c_top = 0
+
+    while s_top > 0:                                 # While the stack is not empty
+        current_vertex = stack[s_top - 1]            # Call the last element in the stack current_vertex
+        c = cursor[current_vertex]                   # Resume the scan where it stopped last time, so each half-edge is looked at once overall
+        end = row_ptr[current_vertex + 1]
+        while c < end and used[edge_id[c]]:          # Skip over half-edges whose shared edge has already been walked
+            c += 1
+        cursor[current_vertex] = c
+
+        if c < end:                                  # If there are still edges to be checked
+            used[edge_id[c]] = True                  # Mark the edge as seen from both ends at once
+            cursor[current_vertex] = c + 1
+            stack[s_top] = neighbours[c]             # Add the neighbour of the vertex to the stack to be considered
+            s_top += 1
+
+        else:                                        # If there are no more vertices which havent been considered
+            s_top -= 1                               # Pop from the stack
+            circuit[c_top] = current_vertex          # and add to the circuit
+            c_top += 1
+
+    return circuit[:c_top]
+
+hierholzer_kernel_python = hierholzer_kernel         # Keep the plain function reachable under its own name - build_hierholzer_aot.py compiles this one
+
+if njit is not None:                                 # Compile the kernel with an explicit signature so no type inference is needed at call time
+    hierholzer_kernel = njit("int32[:](int32[:], int32[:], int32[:], boolean[:], int32)", cache = True)(hierholzer_kernel)
+
+try:                                                 # Prefer the ahead-of-time compiled kernel when it has been built (see build_hierholzer_aot.py) -
+    from hierholzer_aot import hierholzer as hierholzer_kernel   # unlike the JIT, it costs nothing on the first call
+except ImportError:
+    pass
+
+###########################################
+
+def format_circuit(circuit, mapping, as_list):
+
+    """
+    Parameters
+    ------------
+    circuit - a finished circuit as an int32 array or a list of ints
+    mapping - the integer-to-original label dict from relabel_to_integers, or None
+    as_list - True to return a plain Python list instead of an array
+
+    Returns
+    ------------
+    The circuit as an int32 numpy array by default, or a list when as_list is True
+
+    """
+
+    if mapping is not None:                          # Translate the circuit back to the caller's labels
+        relabelled = [mapping[int(v)] for v in circuit]
+        return relabelled if as_list else np.asarray(relabelled)
+
+    if as_list:
+        return circuit.tolist() if isinstance(circuit, np.ndarray) else circuit
+
+    return np.asarray(circuit, dtype = np.int32)     # No copy when the kernel already produced an int32 array
+
+###########################################
+
+def is_eulerian_csr(row_ptr, neighbours, degrees = None):
+
+    """
+    Parameters
+    ------------
+    row_ptr, neighbours - CSR-style arrays from graph_to_csr
+    degrees - optional array of true vertex degrees, for callers whose row pointers undercount (e.g. self-loops in a scipy adjacency matrix)
+
+    Returns
+    ------------
+    eulerian - True if every vertex has even degree and all positive degree vertices are connected
+    start - the vertex a circuit should start from (the first positive degree vertex), or -1 when there is no circuit
+
+    """
+
+    if degrees is None:
+        degrees = np.diff(row_ptr).astype(np.int32)  # Degree of each vertex, straight from the row pointers
+    if np.bitwise_or.reduce(degrees & 1) != 0:       # OR together every parity bit in one vectorised reduction - any odd degree vertex rules out a circuit
+        return False, -1
+
+    if degrees.sum() == 0:                           # No edges at all - only the single vertex graph keeps its trivial circuit, as nx.is_eulerian has it
+        return (True, 0) if degrees.shape[0] == 1 else (False, -1)
+
+    first = int(np.argmax(degrees > 0))              # Start the traversal from the first positive degree vertex
+    N = degrees.shape[0]
+    reached = bfs_count(row_ptr, neighbours, np.int32(first), np.int32(N))
+
+    if int(reached) != int((degrees > 0).sum()):     # Eulerian when every positive degree vertex was reached
+        return False, -1
+
+    return True, first                               # The circuit must begin on a positive degree vertex, not necessarily vertex 0
+
+###########################################
+
+def Eulerian_circuit_1(G, as_list = False):
+
+    """
+    Parameters
+    ------------
+    G - a connected networkx graph
+    as_list - True to return a plain Python list instead of an int32 numpy array
+
+    Returns
+    ------------
+    circuit - the nodes in the graph which dictate an Eulerian circuit, as an int32 numpy array by default
+
+    """
+
+    G, mapping = relabel_to_integers(G)                          # Integer labels are what lets every loop below index plain arrays
+
+    m = G.number_of_edges()
+    row_ptr, neighbours, edge_id = graph_to_csr(G)               # Convert the graph to flat arrays once, instead of mutating G in the loop
+
+    eulerian, start = is_eulerian_csr(row_ptr, neighbours)       # Parity and connectivity checked on the arrays just built - one traversal, not three
+    if not eulerian:
+        return None
+
+    used = np.zeros(m, dtype = bool)                             # One flag per edge, set once the edge has been walked
+
+    circuit = hierholzer_kernel(neighbours, row_ptr, edge_id, used, np.int32(start))
+
+    return format_circuit(circuit, mapping, as_list)
+
+
+###########################################
+
+def pack_adjacency(indptr, indices, N):
+
+    """
+    Parameters
+    ------------
+    indptr, indices - CSR arrays of the adjacency matrix
+    N - the number of vertices in the graph
+
+    Returns
+    ------------
+    Fbits - a (N, ceil(N/64)) uint64 array where bit j of row v is set when edge (v, j) is present
+
+    """
+
+    Fbits = np.zeros((N, (N + 63) // 64), dtype = np.uint64)   # 64 adjacency flags per word - an eighth of the memory of a byte matrix
+    for v in range(N):
+        for i in range(indptr[v], indptr[v + 1]):
+            j = int(indices[i])
+            Fbits[v, j >> 6] |= np.uint64(1 << (j & 63))       # Set bit j of row v
+
+    return Fbits
+
 ###########################################
 
-def Eulerian_circuit_1(G):
+def first_nonzero_word(row):
 
     """
     Parameters
     ------------
-    G - a connected networkx graph 
-    
+    row - a 1-D uint64 array of packed adjacency words
+
     Returns
     ------------
-    circuit - a list of nodes in the graph which dictate an Eulerian circuit 
+    The index of the first non-zero word, or len(row) if every word is zero
+
+    """
+
+    W = row.shape[0]
+    first = W
+    for i in prange(W):                                        # Parallel min-reduction over the word array
+        if row[i] != 0:
+            first = min(first, i)
+
+    return first
+
+if njit is not None:                                           # Threads split the row between them; worth it only on wide rows
+    first_nonzero_word = njit("int64(uint64[:])", parallel = True, cache = True)(first_nonzero_word)
+
+###########################################
+
+def first_set_bit(row):
 
     """
+    Parameters
+    ------------
+    row - a 1-D uint64 array of packed adjacency words
 
-    if not nx.is_eulerian(G):          
-        return None 
+    Returns
+    ------------
+    The index of the lowest set bit across the row, or -1 if every word is zero
 
-    u = 0                            
-    stack = [u]                             # Initialise a stack of vertices
-    circuit = []                            # Initialise an output circuit
+    """
 
-    while stack:                            # While the stack is not empty 
-        current_vertex = stack[-1]          # Call the last element in the stack current_vertex
-        F = list(G.edges(current_vertex))   # To avoid using a for - loop, create a list of vertices and remove from them as they have been 'seen'  
-        if F:                               # If there are still edges to be checked 
-            e = F[-1]                       # Pick the first element in the list of unchecked vertices
-            G.remove_edge(e[0],e[1])        # Remove this edge from the graph                         
-            stack.append(e[1])              # Add the neighbours of the vertex to the stack to be considered
+    if row.shape[0] > 32:                                      # Wide row (over 2048 vertices) - scan the words in parallel to amortise thread launch
+        w_i = first_nonzero_word(row)
+        if w_i == row.shape[0]:
+            return -1
+        w = int(row[w_i])
+        return (w_i << 6) + (w & -w).bit_length() - 1
 
-        else:                               # If there are no more vertices which havent been considered
-            current_vertex = stack.pop()    # Pop from the stack 
-            circuit.append(current_vertex)  # and add to the circuit 
-             
-    return circuit
+    for w_i in range(row.shape[0]):
+        w = int(row[w_i])
+        if w:
+            return (w_i << 6) + (w & -w).bit_length() - 1      # Lowest set bit of the first non-zero word
 
+    return -1
 
 ###########################################
 
 
-def Eulerian_circuit_2(G):
+def Eulerian_circuit_2(G, as_list = False):
 
     """
     Parameters
     ------------
-    G - a connected networkx graph 
-    
+    G - a connected networkx graph
+    as_list - True to return a plain Python list instead of an int32 numpy array
+
     Returns
     ------------
-    circuit - a list of nodes in the graph which dictate an Eulerian circuit 
+    circuit - the nodes in the graph which dictate an Eulerian circuit, as an int32 numpy array by default
 
     """
 
-    if not nx.is_eulerian(G):                          # Check the graph is Eulerian  
-         print(f"This graph is not Eulerian" )     
+    G, mapping = relabel_to_integers(G)                # Integer labels are what lets every loop below index plain arrays
+
+    m = G.number_of_edges()
+    N = G.number_of_nodes()
+    A = nx.adjacency_matrix(G, nodelist = range(N)).tocsr()   # Keep the sparse matrix representation - O(V + E) memory instead of a dense V x V array
+    indptr = A.indptr.astype(np.int32)                 # The neighbours of v sit in indices[indptr[v]:indptr[v+1]]
+    indices = A.indices.astype(np.int32)
+
+    degrees = (np.diff(indptr) + A.diagonal()).astype(np.int32)   # The matrix stores a self-loop as one entry, so add the diagonal back to get true degrees
+
+    eulerian, start = is_eulerian_csr(indptr, indices, degrees)   # Parity and connectivity checked on the arrays just built - one traversal, not three
+    if not eulerian:
+         print(f"This graph is not Eulerian" )
          return None
 
-    stack = [0]                                        # Initialise the stack 
-    circuit = []                                       # initialise the circuit, empty at first
-    F = np.array(nx.adjacency_matrix(G).todense())     # Establish a matrix representation of the graph G 
-    
-    while stack:                                       # While the stack is not empty 
-        
-        current_vertex = stack[-1]                     # Check the vertex at the end of           
-        
-        if  (F[current_vertex]).any() == 1:            # If the node has any vertices not considered
-            edge = np.nonzero(F[current_vertex])[0][0] # Pick a neighbour not yet considered
-            F[current_vertex][edge] = 0                # Set to 0, meaning seen  
-            F[edge][current_vertex] = 0                # Do the same to the mirror vertex 
-            stack.append(edge)                         # Add the edge to the stack 
-          
+    if 2 * m > (N * N) // 4:                           # Dense graph - a packed bitmap beats the sparse slices, and one word covers 64 neighbours
+        stack = [0] * (m + 1)                          # Preallocated - the stack never holds more than m + 1 vertices
+        circuit = [0] * (m + 1)                        # and a full circuit has exactly m + 1 entries
+        stack[0] = start                               # Begin on a positive degree vertex
+        s_top = 0                                      # Index of the current top of the stack
+        c_top = -1                                     # Index of the last vertex written to the circuit
+        Fbits = pack_adjacency(indptr, indices, N)
+        while s_top >= 0:                              # Same stack walk as below, but "first unseen neighbour" is a scan over N/64 words
+            current_vertex = stack[s_top]
+            j = first_set_bit(Fbits[current_vertex])
+            if j >= 0:
+                Fbits[current_vertex, j >> 6] &= ~np.uint64(1 << (j & 63))           # Clear the edge from both rows, meaning seen
+                Fbits[j, current_vertex >> 6] &= ~np.uint64(1 << (current_vertex & 63))
+                s_top += 1
+                stack[s_top] = j
+            else:
+                s_top -= 1
+                c_top += 1
+                circuit[c_top] = current_vertex
+        return format_circuit(circuit[:c_top + 1], mapping, as_list)
+
+    edge_id = np.empty(len(indices), dtype = np.int32) # Shared id per undirected edge, so (u,v) and (v,u) mark the same slot
+    ids = {}
+    for v in range(N):
+        for i in range(indptr[v], indptr[v + 1]):
+            nb = indices[i]
+            key = (v, nb) if v < nb else (nb, v)       # Canonical (small, large) key for the undirected edge
+            edge_id[i] = ids.setdefault(key, len(ids))
+
+    used = np.zeros(m, dtype = np.bool_)               # One flag per edge instead of clearing matrix entries
+    cursor = indptr[:-1].copy()                        # Next candidate position per vertex, so slices are never rescanned from the start
+
+    stack = [0] * (m + 1)                              # Preallocated stack and circuit, as in the dense branch
+    circuit = [0] * (m + 1)
+    stack[0] = start                                   # Begin on a positive degree vertex
+    s_top = 0
+    c_top = -1
+
+    while s_top >= 0:                                  # While the stack is not empty
+
+        current_vertex = stack[s_top]                  # Check the vertex at the top of the stack
+
+        c = cursor[current_vertex]                     # Resume the scan where it stopped last time - each position is visited at most once overall
+        end = indptr[current_vertex + 1]
+        while c < end and used[edge_id[c]]:
+            c += 1
+        cursor[current_vertex] = c
+
+        if c < end:                                    # If the node has any vertices not considered
+            used[edge_id[c]] = True                    # Mark the edge as seen, from both ends at once
+            s_top += 1
+            stack[s_top] = int(indices[c])             # Add the neighbour to the stack
+
         else:                                          # If there are no more vertices which havent been considered
-            current_vertex = stack.pop()               # Pop from the stack 
-            circuit.append(current_vertex)             # and add to the circuit 
-             
-    return circuit
+            s_top -= 1                                 # Pop from the stack
+            c_top += 1
+            circuit[c_top] = current_vertex            # and add to the circuit
+
+    return format_circuit(circuit[:c_top + 1], mapping, as_list)
 
 
 ###########################################
 
-def Eulerian_circuit_3(G):
+def Eulerian_circuit_3(G, as_list = False):
 
     """
     Parameters
     ------------
-    G - a connected networkx graph 
-    
+    G - a connected networkx graph
+    as_list - True to return a plain Python list instead of an int32 numpy array
+
     Returns
     ------------
-    circuit - a list of nodes in the graph which dictate an Eulerian circuit 
+    circuit - the nodes in the graph which dictate an Eulerian circuit, as an int32 numpy array by default
 
     """
 
-    if not nx.is_eulerian(G):          
+    G, mapping = relabel_to_integers(G)                                      # Integer labels are what lets every loop below index plain arrays
+
+    row_ptr, neighbours, csr_edge_id = graph_to_csr(G)                       # One conversion covers both the parity and connectivity checks
+    eulerian, start = is_eulerian_csr(row_ptr, neighbours)
+    if not eulerian:
         return None
-    
-    u = 0                            
-    stack = [u]                                  # Initialise data  
-    seen = []
-    circuit = []
-
-    while stack:                                 # While the stack is not empty 
-    
-        current_vertex = stack[-1]
-        T = [(current_vertex,neighbour) for neighbour in G[current_vertex] if {current_vertex,neighbour} not in seen]
-        if T:                                    # If there are neighbours which haven't been seen 
-            edge = T[0]                          # Take first edge we haven't seen 
-            seen.append(set(edge))               # Mark these as seen, using sets to negate direction  
-            stack.append(edge[1])                # Append edge to the stack 
+
+    m = G.number_of_edges()
+    N = G.number_of_nodes()
+
+    def eid(u, v):                               # Canonical min*N+max key - hashing an int is far cheaper than hashing a frozenset
+        return u * N + v if u < v else v * N + u
+
+    edge_id = {eid(u, v): k for k, (u, v) in enumerate(G.edges())}   # Number each edge once, the key negates direction
+    used = bytearray(m)                          # One flag per edge - O(1) lookup instead of scanning a list of seen edges
+
+    u = start                                    # Begin on a positive degree vertex
+    stack = [0] * (m + 1)                        # Preallocated stack and circuit - both are bounded by m + 1 entries
+    circuit = [0] * (m + 1)
+    stack[0] = u                                 # Initialise data
+    s_top = 0
+    c_top = -1
+
+    while s_top >= 0:                            # While the stack is not empty
+
+        current_vertex = stack[s_top]
+        neighbour = next((nb for nb in G[current_vertex] if not used[edge_id[eid(current_vertex, nb)]]), None)
+        if neighbour is not None:                # If there are neighbours which haven't been seen
+            used[edge_id[eid(current_vertex, neighbour)]] = 1   # Mark the edge as seen
+            s_top += 1
+            stack[s_top] = neighbour             # Append the neighbour to the stack
 
         else:
-            current_vertex = stack.pop()   
-            circuit.append(current_vertex)
-            
-    return circuit
+            s_top -= 1
+            c_top += 1
+            circuit[c_top] = current_vertex
+
+    return format_circuit(circuit[:c_top + 1], mapping, as_list)
+
+###########################################
+
+def bfs_count_python(row_ptr, neighbours, start, N):
+
+    """
+    Parameters and return value as for bfs_count - this is the interpreter-level version used when numba is unavailable.
+
+    """
+
+    visited = np.zeros(N, dtype = np.bool_)          # Replaces the Python set of seen vertices
+    visited[start] = True
+    queue = deque((int(start),))
+    count = 1
+
+    while queue:                                     # While there are still things in the queue
+        current_vertex = queue.popleft()             # Get the first thing in the queue
+        nbrs = neighbours[row_ptr[current_vertex]:row_ptr[current_vertex + 1]]   # One C-level slice instead of per-neighbour dict lookups
+        fresh = nbrs[~visited[nbrs]]                 # Neighbours not seen before this step
+        visited[fresh] = True                        # Mark them all in a single vectorised store
+        queue.extend(fresh.tolist())
+        count += fresh.size
+
+    return count
+
+###########################################
+
+def bfs_count(row_ptr, neighbours, start, N):
+
+    """
+    Parameters
+    ------------
+    row_ptr, neighbours - CSR-style arrays from graph_to_csr
+    start - the vertex to start the traversal from
+    N - the number of vertices in the graph
+
+    Returns
+    ------------
+    The number of vertices reachable from start, including start itself
+
+    """
+
+    visited = np.zeros(N, dtype = np.bool_)          # Replaces the Python set of seen vertices
+    queue = np.empty(N, dtype = np.int32)            # Ring-buffer queue - each vertex enters at most once, so N slots suffice
+    queue[0] = start
+    head = 0
+    tail = 1
+    visited[start] = True
+    count = 1
+
+    while head < tail:                               # While there are still things in the queue
+        current_vertex = queue[head]                 # Get the first thing in the queue
+        head += 1
+        for i in range(row_ptr[current_vertex], row_ptr[current_vertex + 1]):
+            nb = neighbours[i]
+            if not visited[nb]:                      # Enqueue each neighbour the first time it is seen
+                visited[nb] = True
+                queue[tail] = nb
+                tail += 1
+                count += 1
+
+    return count
+
+if njit is not None:                                 # Compile the traversal with an explicit signature, like the Hierholzer kernel
+    bfs_count = njit("int32(int32[:], int32[:], int32, int32)", cache = True)(bfs_count)
+else:                                                # Without numba the deque version with vectorised slice copies is the faster one
+    bfs_count = bfs_count_python
 
 ###########################################
 
 
-def all_positive_degree_vertices_connected(G):      
+def all_positive_degree_vertices_connected(G):
 
     """
     Parameters
     ------------
-    G - a networkx graph 
-    
+    G - a networkx graph
+
     Returns
     ------------
     A bool value: True if the graph is connected, False if not
 
     """
-    pos_deg = [i for i in G if len(list(G[i])) > 0]  # Create a list of the positive degree vertices 
+    G, mapping = relabel_to_integers(G)              # Integer labels so the CSR arrays can be indexed directly
 
-    u = pos_deg[0]                                   # Initialise data for breadth-traversal 
-    queue = deque()
-    queue.append(u)
-    seen = set()
-    while queue:                                     # While there are still things in the queue
-        current_vertex = queue.popleft()             # Get the first thing in the queue
+    N = G.number_of_nodes()
+    row_ptr, neighbours, edge_id = graph_to_csr(G)   # Convert to flat arrays once so the traversal never touches NetworkX dicts
+
+    degrees = np.diff(row_ptr)                       # Degrees fall straight out of the row pointers
+    pos_deg = np.flatnonzero(degrees)                # The positive degree vertices, without allocating a neighbour list per node
+
+    u = int(pos_deg[0])                              # Start the breadth-traversal from any positive degree vertex
+    count = bfs_count(row_ptr, neighbours, np.int32(u), np.int32(N))
+
+    if count == pos_deg.size:                        # Connected exactly when every positive degree vertex was reached
 
-        if current_vertex not in seen:
-            seen.add(current_vertex)
-            queue.extend(G[current_vertex])          # Add all of the neighbours of current_vertex to the end of the queue.
-     
-    if len(seen) == len(pos_deg):                    #  
-                
         return True
-    else:  
+    else:
         return False
 
 ###########################################
@@ -0,0 +1,18 @@
+# Ahead-of-time compiles the Hierholzer kernel into a hierholzer_aot extension module, so the first call pays no JIT
+# compilation cost. Run once from this directory:
+#
+#     python build_hierholzer_aot.py
+#
+# Eulerian_Circuit_functions picks the compiled kernel up automatically if the extension is present, and falls back to
+# the njit (or plain Python) version otherwise.
+
+from numba.pycc import CC
+
+from Eulerian_Circuit_functions import hierholzer_kernel_python   # The plain function - hierholzer_kernel itself may already be the compiled extension
+
+cc = CC('hierholzer_aot')
+
+cc.export('hierholzer', 'i4[:](i4[:], i4[:], i4[:], b1[:], i4)')(hierholzer_kernel_python)
+
+if __name__ == "__main__":
+    cc.compile()